@@ -1,3 +1,6 @@
+import glob
+import hashlib
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -7,6 +10,16 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Rows shown per page in the data table
+PAGE_SIZE = 500
+
+# Scatter plots above this many points are thinned to an x-bucketed envelope
+SCATTER_MAX_POINTS = 5000
+SCATTER_BINS = 200
+
+# Filter selections remembered by each per-filter aggregate and figure cache
+FILTER_CACHE_ENTRIES = 32
+
 # Configure the page
 st.set_page_config(
     page_title="Mobile Device Usage and User Behavior Dashboard",
@@ -38,23 +51,349 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Compact column types: categorical columns make the filter comparisons cheap
+# code lookups and the narrower numeric types halve the bytes every reduction
+# has to scan.
+COLUMN_DTYPES = {
+    'Gender': 'category',
+    'Operating System': 'category',
+    'Device Model': 'category',
+    'Age': 'int16',
+    'Number of Apps Installed': 'int16',
+    'User Behavior Class': 'int16',
+    'Screen On Time (hours/day)': 'float32',
+    'App Usage Time (min/day)': 'float32',
+    'Battery Drain (mAh/day)': 'float32',
+    'Data Usage (MB/day)': 'float32'
+}
+
+AGE_GROUPS = ['18-25', '26-35', '36-45', '46-59']
+# Upper (inclusive) age of every group but the last
+AGE_BIN_EDGES = [25, 35, 45]
+
+CORRELATION_VARS = [
+    'Age', 'Screen On Time (hours/day)', 'App Usage Time (min/day)',
+    'Battery Drain (mAh/day)', 'Data Usage (MB/day)', 'Number of Apps Installed'
+]
+
+DATA_CSV = 'user_behavior_dataset.csv'
+# Bump when the way load_data derives columns changes; COLUMN_DTYPES,
+# AGE_GROUPS and AGE_BIN_EDGES are folded into the schema tag automatically.
+DATA_SCHEMA_VERSION = 1
+DATA_SCHEMA_TAG = hashlib.sha1(
+    repr((DATA_SCHEMA_VERSION, sorted(COLUMN_DTYPES.items()), AGE_GROUPS, AGE_BIN_EDGES)).encode()
+).hexdigest()[:8]
+# Typed columnar copy of the CSV, written on first load. The schema tag in the
+# name keeps a copy written under older dtypes from being served.
+DATA_PARQUET = f'user_behavior_dataset.{DATA_SCHEMA_TAG}.parquet'
+
+def save_parquet_copy(df):
+    """Atomically write the typed frame to DATA_PARQUET"""
+    tmp_path = f"{DATA_PARQUET}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', index=False)
+        os.replace(tmp_path, DATA_PARQUET)
+    except OSError:
+        # Read-only deployment or full disk: keep serving from the CSV
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+
+    # Copies written under an older schema tag are never read again
+    for stale_path in glob.glob('user_behavior_dataset.*.parquet'):
+        if stale_path != DATA_PARQUET:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+
 # Load and cache data
 @st.cache_data
 def load_data():
     """Load the dataset"""
     try:
-        df = pd.read_csv('user_behavior_dataset.csv')
-        # Create age groups
-        df['Age_Group'] = pd.cut(df['Age'], 
-                                bins=[17, 25, 35, 45, 59], 
-                                labels=['18-25', '26-35', '36-45', '46-59'])
+        if os.path.exists(DATA_PARQUET) and os.path.getmtime(DATA_PARQUET) >= os.path.getmtime(DATA_CSV):
+            try:
+                return pd.read_parquet(DATA_PARQUET, engine='pyarrow')
+            except (OSError, ValueError):
+                # Unreadable copy: rebuild it from the CSV below
+                pass
+
+        df = pd.read_csv(DATA_CSV, dtype=COLUMN_DTYPES)
+        # Create age groups (bins are right-inclusive, so 25 falls in '18-25')
+        codes = np.searchsorted(AGE_BIN_EDGES, df['Age'].values, side='left').astype('int8')
+        df['Age_Group'] = pd.Categorical.from_codes(codes, categories=AGE_GROUPS)
+        save_parquet_copy(df)
         return df
     except FileNotFoundError:
-        st.error("❌ Dataset file 'user_behavior_dataset.csv' not found!")
+        st.error(f"❌ Dataset file '{DATA_CSV}' not found!")
         st.stop()
 
+@st.cache_data
+def baseline_means(_df):
+    """Dataset-wide averages used as the reference for metric deltas"""
+    # The leading underscore stops Streamlit hashing the static loaded frame
+    return {
+        'screen': _df['Screen On Time (hours/day)'].mean(),
+        'app': _df['App Usage Time (min/day)'].mean(),
+        'battery': _df['Battery Drain (mAh/day)'].mean()
+    }
+
+@st.cache_data
+def filter_options(_df):
+    """Sorted choices for the sidebar selectboxes"""
+    return {
+        'gender': _df['Gender'].cat.categories.tolist(),
+        'os': _df['Operating System'].cat.categories.tolist(),
+        'device': _df['Device Model'].cat.categories.tolist()
+    }
+
+def apply_filters(df, age_range, gender, os_name, device):
+    """Return the rows matching the sidebar selections"""
+    masks = [df['Age'].values >= age_range[0], df['Age'].values <= age_range[1]]
+
+    for column, selection in [('Gender', gender),
+                              ('Operating System', os_name),
+                              ('Device Model', device)]:
+        if selection != 'All':
+            masks.append(df[column].cat.codes.values == df[column].cat.categories.get_loc(selection))
+
+    return df.iloc[np.logical_and.reduce(masks)]
+
+# Cached aggregates, keyed on the filter selections. The static loaded frame is
+# passed as _df so Streamlit leaves it out of the cache key instead of hashing
+# it on every call.
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def demo_agg(_df, age_range, gender, os_name, device):
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    return sub.groupby(['Age_Group', 'Gender'], observed=True, sort=False)['Screen On Time (hours/day)'].mean().reset_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def device_agg(_df, age_range, gender, os_name, device):
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    return sub.groupby('Device Model', observed=True, sort=False)['Screen On Time (hours/day)'].mean().sort_values().astype('float32')
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def os_agg(_df, age_range, gender, os_name, device):
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    # Sorted so the grouped bars keep their places as the filters change
+    os_comparison = sub.groupby('Operating System', observed=True)[
+        ['Screen On Time (hours/day)', 'App Usage Time (min/day)', 'Data Usage (MB/day)']
+    ].mean()
+    # Long format so a single px.bar call draws one trace per metric
+    return os_comparison.reset_index().melt(id_vars='Operating System', var_name='Metric', value_name='Value')
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def behavior_agg(_df, age_range, gender, os_name, device):
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    # Classes are small integers, so a bincount replaces hashing every row
+    counts = np.bincount(sub['User Behavior Class'].to_numpy(dtype=np.intp))
+    classes = np.nonzero(counts)[0]
+    return pd.Series(counts[classes], index=classes)
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def hist_agg(_df, age_range, gender, os_name, device, column, bins=20, bin_width=None):
+    """Bin centers, widths and counts of `column`, binned server-side"""
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    values = sub[column].to_numpy()
+    if bin_width is not None:
+        # Edges on multiples of bin_width so reference lines fall on bin edges
+        lo = np.floor(values.min() / bin_width) * bin_width
+        n_bins = int((values.max() - lo) // bin_width) + 1
+        bins = lo + bin_width * np.arange(n_bins + 1)
+    elif np.issubdtype(values.dtype, np.integer):
+        # Whole-number bins of equal width, at most `bins` of them, so no bin
+        # covers more distinct values than another
+        lo, hi = int(values.min()), int(values.max())
+        step = -(-(hi - lo + 1) // bins)
+        n_bins = -(-(hi - lo + 1) // step)
+        bins = np.arange(lo, lo + n_bins * step + 1, step) - 0.5
+    counts, edges = np.histogram(values, bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, np.diff(edges), counts
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def box_agg(_df, age_range, gender, os_name, device):
+    """Five-number summary of data usage per behavior class"""
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    return sub.groupby('User Behavior Class', sort=False)['Data Usage (MB/day)'].quantile(
+        [0, 0.25, 0.5, 0.75, 1]
+    ).unstack().sort_index()
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def corr_agg(_df, age_range, gender, os_name, device, correlation_vars):
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    arr = sub[correlation_vars].to_numpy(dtype=np.float32, copy=False)
+    # Single rows and constant columns (e.g. a one-year age range) give NaN,
+    # as DataFrame.corr() did, without warning in the server log
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.corrcoef(arr, rowvar=False)
+    return pd.DataFrame(corr, index=correlation_vars, columns=correlation_vars)
+
+def histogram_bar(centers, widths, counts, column, **bar_kwargs):
+    """Bar figure drawing precomputed histogram bins"""
+    fig = go.Figure(go.Bar(x=centers, width=widths, y=counts, **bar_kwargs))
+    fig.update_layout(xaxis_title=column, yaxis_title="count")
+    return fig
+
+def thin_scatter(df, x, y, bins=SCATTER_BINS):
+    """Keep the lowest and highest y point in each of `bins` x buckets"""
+    xs = df[x].to_numpy()
+    ys = df[y].to_numpy()
+    span = xs.max() - xs.min()
+    if span == 0:
+        buckets = np.zeros(len(xs), dtype=np.intp)
+    else:
+        buckets = np.minimum(((xs - xs.min()) / span * bins).astype(np.intp), bins - 1)
+
+    # Sort by bucket, then y, so each bucket's min and max sit at its edges
+    order = np.lexsort((ys, buckets))
+    _, first = np.unique(buckets[order], return_index=True)
+    last = np.append(first[1:], len(order)) - 1
+    keep = np.unique(np.concatenate([order[first], order[last]]))
+    return df.iloc[keep]
+
+# Cached figure builders, keyed on the filter selections like the aggregates.
+# st.cache_resource hands back the same read-only figure instead of rebuilding
+# or copying it.
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_age_hist(_df, age_range, gender, os_name, device):
+    fig = histogram_bar(*hist_agg(_df, age_range, gender, os_name, device, 'Age'), 'Age',
+                        marker_color='#1f77b4')
+    fig.update_layout(title="Age Distribution", height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_demo_bar(_df, age_range, gender, os_name, device):
+    fig = px.bar(
+        demo_agg(_df, age_range, gender, os_name, device),
+        x='Age_Group',
+        y='Screen On Time (hours/day)',
+        color='Gender',
+        title="Screen Time by Age Group and Gender",
+        category_orders={'Age_Group': AGE_GROUPS},
+        color_discrete_map={'Male': 'darkgreen', 'Female': 'purple'}
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_usage_scatter(_df, age_range, gender, os_name, device):
+    sub = apply_filters(_df, age_range, gender, os_name, device)
+    # Thin the points when the plot would be overplotted anyway
+    if len(sub) > SCATTER_MAX_POINTS:
+        sub = thin_scatter(sub, 'App Usage Time (min/day)', 'Battery Drain (mAh/day)')
+    fig = px.scatter(
+        sub,
+        x='App Usage Time (min/day)',
+        y='Battery Drain (mAh/day)',
+        color='User Behavior Class',
+        title="App Usage vs Battery Drain",
+        hover_data=['Age', 'Gender', 'Device Model']
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_screen_hist(_df, age_range, gender, os_name, device):
+    column = 'Screen On Time (hours/day)'
+    fig = histogram_bar(*hist_agg(_df, age_range, gender, os_name, device, column, bin_width=0.5),
+                        column)
+    # Add threshold lines
+    fig.add_vline(x=8, line_dash="dash", line_color="orange",
+                  annotation_text="High Usage (8h)")
+    fig.add_vline(x=10, line_dash="dash", line_color="red",
+                  annotation_text="Extreme Usage (10h)")
+    fig.update_layout(title="Screen Time Distribution", height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_device_bar(_df, age_range, gender, os_name, device):
+    device_usage = device_agg(_df, age_range, gender, os_name, device)
+    values = device_usage.to_numpy()
+    fig = go.Figure(go.Bar(
+        x=values,
+        y=device_usage.index.to_list(),
+        orientation='h',
+        marker=dict(color=values, colorscale='viridis', showscale=True)
+    ))
+    fig.update_layout(title="Average Screen Time by Device Model", height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_os_bar(_df, age_range, gender, os_name, device):
+    fig = px.bar(
+        os_agg(_df, age_range, gender, os_name, device),
+        x='Operating System',
+        y='Value',
+        color='Metric',
+        barmode='group',
+        title="iOS vs Android Usage Comparison"
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_behavior_pie(_df, age_range, gender, os_name, device):
+    behavior_counts = behavior_agg(_df, age_range, gender, os_name, device)
+    fig = px.pie(
+        values=behavior_counts.values,
+        names=[f"Class {i}" for i in behavior_counts.index],
+        title="User Behavior Class Distribution"
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_data_box(_df, age_range, gender, os_name, device):
+    summary = box_agg(_df, age_range, gender, os_name, device)
+    fig = go.Figure()
+    for cls, q in summary.iterrows():
+        fig.add_trace(go.Box(
+            name=f"Class {cls}",
+            x=[cls],
+            lowerfence=[q[0]],
+            q1=[q[0.25]],
+            median=[q[0.5]],
+            q3=[q[0.75]],
+            upperfence=[q[1]],
+            marker_color='#636efa',
+            showlegend=False
+        ))
+    fig.update_layout(
+        title="Data Usage by Behavior Class",
+        xaxis_title='User Behavior Class',
+        yaxis_title='Data Usage (MB/day)',
+        height=400
+    )
+    return fig
+
+@st.cache_resource(max_entries=FILTER_CACHE_ENTRIES)
+def build_corr_heatmap(_df, age_range, gender, os_name, device):
+    correlation_matrix = corr_agg(_df, age_range, gender, os_name, device, CORRELATION_VARS)
+    fig = go.Figure(go.Heatmap(
+        z=correlation_matrix.to_numpy(),
+        x=CORRELATION_VARS,
+        y=CORRELATION_VARS,
+        colorscale='RdBu'
+    ))
+    fig.update_layout(
+        title="Correlation Matrix - Usage Metrics",
+        yaxis_autorange='reversed',
+        height=500
+    )
+    return fig
+
+@st.cache_data(max_entries=FILTER_CACHE_ENTRIES)
+def to_csv_bytes(df):
+    """Encoded CSV export of the filtered data"""
+    return df.to_csv(index=False).encode()
+
 # Load data
 df = load_data()
+baseline = baseline_means(df)
+opts = filter_options(df)
 
 # Dashboard Title
 st.markdown('<h1 class="main-header">📱 Mobile Device Usage Dashboard</h1>', unsafe_allow_html=True)
@@ -71,31 +410,20 @@ age_range = st.sidebar.slider(
 )
 
 # Gender filter
-gender_options = ['All'] + list(df['Gender'].unique())
+gender_options = ['All'] + opts['gender']
 selected_gender = st.sidebar.selectbox("Select Gender", gender_options)
 
 # OS filter
-os_options = ['All'] + list(df['Operating System'].unique())
+os_options = ['All'] + opts['os']
 selected_os = st.sidebar.selectbox("Select Operating System", os_options)
 
 # Device filter
-device_options = ['All'] + list(df['Device Model'].unique())
+device_options = ['All'] + opts['device']
 selected_device = st.sidebar.selectbox("Select Device Model", device_options)
 
 # Apply filters
-filtered_df = df[
-    (df['Age'] >= age_range[0]) & 
-    (df['Age'] <= age_range[1])
-]
-
-if selected_gender != 'All':
-    filtered_df = filtered_df[filtered_df['Gender'] == selected_gender]
-
-if selected_os != 'All':
-    filtered_df = filtered_df[filtered_df['Operating System'] == selected_os]
-
-if selected_device != 'All':
-    filtered_df = filtered_df[filtered_df['Device Model'] == selected_device]
+filters = (age_range, selected_gender, selected_os, selected_device)
+filtered_df = apply_filters(df, *filters)
 
 # Display filtered data info
 st.sidebar.markdown("---")
@@ -109,35 +437,40 @@ if len(filtered_df) == 0:
 # Key Metrics Row
 st.markdown('<h2 class="sub-header">📈 Key Metrics</h2>', unsafe_allow_html=True)
 
+# Pull the metric columns out as NumPy arrays once and reduce them directly
+screen_arr = filtered_df['Screen On Time (hours/day)'].to_numpy()
+app_arr = filtered_df['App Usage Time (min/day)'].to_numpy()
+battery_arr = filtered_df['Battery Drain (mAh/day)'].to_numpy()
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    avg_screen_time = filtered_df['Screen On Time (hours/day)'].mean()
+    avg_screen_time = screen_arr.mean()
     st.metric(
         label="Avg Screen Time",
         value=f"{avg_screen_time:.1f} hrs/day",
-        delta=f"{avg_screen_time - df['Screen On Time (hours/day)'].mean():.1f}"
+        delta=f"{avg_screen_time - baseline['screen']:.1f}"
     )
 
 with col2:
-    avg_app_usage = filtered_df['App Usage Time (min/day)'].mean()
+    avg_app_usage = app_arr.mean()
     st.metric(
         label="Avg App Usage",
         value=f"{avg_app_usage:.0f} min/day",
-        delta=f"{avg_app_usage - df['App Usage Time (min/day)'].mean():.0f}"
+        delta=f"{avg_app_usage - baseline['app']:.0f}"
     )
 
 with col3:
-    avg_battery = filtered_df['Battery Drain (mAh/day)'].mean()
+    avg_battery = battery_arr.mean()
     st.metric(
         label="Avg Battery Drain",
         value=f"{avg_battery:.0f} mAh/day",
-        delta=f"{avg_battery - df['Battery Drain (mAh/day)'].mean():.0f}"
+        delta=f"{avg_battery - baseline['battery']:.0f}"
     )
 
 with col4:
-    heavy_users = len(filtered_df[filtered_df['Screen On Time (hours/day)'] >= 8])
-    heavy_percent = (heavy_users / len(filtered_df)) * 100
+    heavy_users = int((screen_arr >= 8).sum())
+    heavy_percent = (heavy_users / len(screen_arr)) * 100
     st.metric(
         label="Heavy Users",
         value=f"{heavy_percent:.1f}%",
@@ -147,171 +480,78 @@ with col4:
 # Visualization Section
 
 
-# Create tabs for different visualizations
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
-    "👥 Demographics", 
-    "📱 Usage Patterns", 
-    "🔋 Device Analysis", 
+# View selector for the different visualizations. Unlike st.tabs, only the
+# selected section is computed and plotted on each rerun.
+views = [
+    "👥 Demographics",
+    "📱 Usage Patterns",
+    "🔋 Device Analysis",
     "🎯 Behavior Classes",
     "🔍 Correlations"
-])
+]
+view = st.radio("View", views, horizontal=True, label_visibility="collapsed")
 
-with tab1:
+if view == views[0]:
     st.subheader("Demographics Analysis")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Age distribution
-        fig_age = px.histogram(
-            filtered_df, 
-            x='Age', 
-            nbins=20,
-            title="Age Distribution",
-            color_discrete_sequence=['#1f77b4']
-        )
-        fig_age.update_layout(height=400)
-        st.plotly_chart(fig_age, use_container_width=True)
+        st.plotly_chart(build_age_hist(df, *filters), use_container_width=True)
     
     with col2:
         # Screen time by age group and gender
-        screen_by_demo = filtered_df.groupby(['Age_Group', 'Gender'])['Screen On Time (hours/day)'].mean().reset_index()
-        fig_demo = px.bar(
-            screen_by_demo,
-            x='Age_Group',
-            y='Screen On Time (hours/day)',
-            color='Gender',
-            title="Screen Time by Age Group and Gender",
-            color_discrete_map={'Male': 'darkgreen', 'Female': 'purple'}
-        )
-        fig_demo.update_layout(height=400)
-        st.plotly_chart(fig_demo, use_container_width=True)
-
-with tab2:
+        st.plotly_chart(build_demo_bar(df, *filters), use_container_width=True)
+
+if view == views[1]:
     st.subheader("Usage Patterns")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # App usage vs battery drain scatter plot
-        fig_scatter = px.scatter(
-            filtered_df,
-            x='App Usage Time (min/day)',
-            y='Battery Drain (mAh/day)',
-            color='User Behavior Class',
-            title="App Usage vs Battery Drain",
-            hover_data=['Age', 'Gender', 'Device Model']
-        )
-        fig_scatter.update_layout(height=400)
-        st.plotly_chart(fig_scatter, use_container_width=True)
+        st.plotly_chart(build_usage_scatter(df, *filters), use_container_width=True)
     
     with col2:
         # Screen time distribution with thresholds
-        fig_hist = px.histogram(
-            filtered_df,
-            x='Screen On Time (hours/day)',
-            title="Screen Time Distribution",
-            nbins=20
-        )
-        # Add threshold lines
-        fig_hist.add_vline(x=8, line_dash="dash", line_color="orange", 
-                          annotation_text="High Usage (8h)")
-        fig_hist.add_vline(x=10, line_dash="dash", line_color="red", 
-                          annotation_text="Extreme Usage (10h)")
-        fig_hist.update_layout(height=400)
-        st.plotly_chart(fig_hist, use_container_width=True)
-
-with tab3:
+        st.plotly_chart(build_screen_hist(df, *filters), use_container_width=True)
+
+if view == views[2]:
     st.subheader("Device Analysis")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Device model usage comparison
-        device_usage = filtered_df.groupby('Device Model')['Screen On Time (hours/day)'].mean().sort_values(ascending=True)
-        fig_device = px.bar(
-            x=device_usage.values,
-            y=device_usage.index,
-            orientation='h',
-            title="Average Screen Time by Device Model",
-            color=device_usage.values,
-            color_continuous_scale='viridis'
-        )
-        fig_device.update_layout(height=400)
-        st.plotly_chart(fig_device, use_container_width=True)
+        st.plotly_chart(build_device_bar(df, *filters), use_container_width=True)
     
     with col2:
         # iOS vs Android comparison
-        os_comparison = filtered_df.groupby('Operating System')[
-            ['Screen On Time (hours/day)', 'App Usage Time (min/day)', 'Data Usage (MB/day)']
-        ].mean()
-        
-        fig_os = go.Figure()
-        
-        for metric in os_comparison.columns:
-            fig_os.add_trace(go.Bar(
-                name=metric,
-                x=os_comparison.index,
-                y=os_comparison[metric]
-            ))
-        
-        fig_os.update_layout(
-            title="iOS vs Android Usage Comparison",
-            barmode='group',
-            height=400
-        )
-        st.plotly_chart(fig_os, use_container_width=True)
-
-with tab4:
+        st.plotly_chart(build_os_bar(df, *filters), use_container_width=True)
+
+if view == views[3]:
     st.subheader("User Behavior Classes")
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Behavior class distribution
-        behavior_counts = filtered_df['User Behavior Class'].value_counts().sort_index()
-        fig_behavior = px.pie(
-            values=behavior_counts.values,
-            names=[f"Class {i}" for i in behavior_counts.index],
-            title="User Behavior Class Distribution"
-        )
-        fig_behavior.update_layout(height=400)
-        st.plotly_chart(fig_behavior, use_container_width=True)
+        st.plotly_chart(build_behavior_pie(df, *filters), use_container_width=True)
     
     with col2:
         # Data usage by behavior class
-        fig_box = px.box(
-            filtered_df,
-            x='User Behavior Class',
-            y='Data Usage (MB/day)',
-            title="Data Usage by Behavior Class"
-        )
-        fig_box.update_layout(height=400)
-        st.plotly_chart(fig_box, use_container_width=True)
-
-with tab5:
+        st.plotly_chart(build_data_box(df, *filters), use_container_width=True)
+
+if view == views[4]:
     st.subheader("Correlation Analysis")
     
     # Correlation heatmap
-    correlation_vars = [
-        'Age', 'Screen On Time (hours/day)', 'App Usage Time (min/day)',
-        'Battery Drain (mAh/day)', 'Data Usage (MB/day)', 'Number of Apps Installed'
-    ]
-    
-    correlation_matrix = filtered_df[correlation_vars].corr()
-    
-    fig_corr = px.imshow(
-        correlation_matrix,
-        title="Correlation Matrix - Usage Metrics",
-        color_continuous_scale='RdBu',
-        aspect="auto"
-    )
-    fig_corr.update_layout(height=500)
-    st.plotly_chart(fig_corr, use_container_width=True)
+    st.plotly_chart(build_corr_heatmap(df, *filters), use_container_width=True)
     
     # Show correlation values
     st.subheader("Correlation Values")
-    st.dataframe(correlation_matrix.round(3))
+    st.dataframe(corr_agg(df, *filters, CORRELATION_VARS).round(3))
 
 # Data Table Section
 st.markdown('<h2 class="sub-header">📋 Filtered Data</h2>', unsafe_allow_html=True)
@@ -319,17 +559,28 @@ st.markdown('<h2 class="sub-header">📋 Filtered Data</h2>', unsafe_allow_html=
 # Show data table with option to download
 st.subheader(f"Data Table ({len(filtered_df)} rows)")
 
-# Add download button
-csv = filtered_df.to_csv(index=False)
-st.download_button(
-    label="📥 Download Filtered Data as CSV",
-    data=csv,
-    file_name='filtered_mobile_usage_data.csv',
-    mime='text/csv'
-)
+# Add download button. The CSV is only built once the user asks for it, and
+# is dropped again as soon as the filters change.
+if st.button("📄 Prepare CSV Download"):
+    st.session_state.csv_export = (filters, to_csv_bytes(filtered_df))
+
+csv_export = st.session_state.get('csv_export')
+if csv_export is not None and csv_export[0] != filters:
+    st.session_state.pop('csv_export', None)
+    csv_export = None
+
+if csv_export is not None:
+    st.download_button(
+        label="📥 Download Filtered Data as CSV",
+        data=csv_export[1],
+        file_name='filtered_mobile_usage_data.csv',
+        mime='text/csv'
+    )
 
-# Display the data
-st.dataframe(filtered_df, use_container_width=True)
+# Display the data one page at a time so only PAGE_SIZE rows reach the browser
+page_count = max(1, (len(filtered_df) - 1) // PAGE_SIZE + 1)
+page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
+st.dataframe(filtered_df.iloc[(page - 1) * PAGE_SIZE : page * PAGE_SIZE], use_container_width=True)
 
 # Footer
 st.markdown("---")